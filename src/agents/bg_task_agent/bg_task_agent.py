@@ -1,4 +1,6 @@
 import asyncio
+from functools import cache
+from operator import itemgetter
 
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.messages import AIMessage
@@ -8,6 +10,7 @@ from langgraph.graph import END, MessagesState, StateGraph
 
 from agents.bg_task_agent.task import Task
 from core import get_model, settings
+from schema import AllModelEnum
 
 
 class AgentState(MessagesState, total=False):
@@ -17,17 +20,20 @@ class AgentState(MessagesState, total=False):
     """
 
 
+preprocessor = RunnableLambda(itemgetter("messages"), name="StateModifier")
+
+
 def wrap_model(model: BaseChatModel) -> RunnableSerializable[AgentState, AIMessage]:
-    preprocessor = RunnableLambda(
-        lambda state: state["messages"],
-        name="StateModifier",
-    )
     return preprocessor | model
 
 
+@cache
+def get_model_runnable(model_name: AllModelEnum) -> RunnableSerializable[AgentState, AIMessage]:
+    return wrap_model(get_model(model_name))
+
+
 async def acall_model(state: AgentState, config: RunnableConfig) -> AgentState:
-    m = get_model(config["configurable"].get("model", settings.DEFAULT_MODEL))
-    model_runnable = wrap_model(m)
+    model_runnable = get_model_runnable(config["configurable"].get("model", settings.DEFAULT_MODEL))
     response = await model_runnable.ainvoke(state, config)
 
     # We return a list, because this will get added to the existing list
@@ -1,3 +1,6 @@
+from functools import cache
+from operator import itemgetter
+
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.messages import AIMessage
 from langchain_core.runnables import RunnableConfig, RunnableLambda, RunnableSerializable
@@ -5,6 +8,7 @@ from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph import END, MessagesState, StateGraph
 
 from core import get_model, settings
+from schema import AllModelEnum
 
 
 class AgentState(MessagesState, total=False):
@@ -14,17 +18,20 @@ class AgentState(MessagesState, total=False):
     """
 
 
+preprocessor = RunnableLambda(itemgetter("messages"), name="StateModifier")
+
+
 def wrap_model(model: BaseChatModel) -> RunnableSerializable[AgentState, AIMessage]:
-    preprocessor = RunnableLambda(
-        lambda state: state["messages"],
-        name="StateModifier",
-    )
     return preprocessor | model
 
 
+@cache
+def get_model_runnable(model_name: AllModelEnum) -> RunnableSerializable[AgentState, AIMessage]:
+    return wrap_model(get_model(model_name))
+
+
 async def acall_model(state: AgentState, config: RunnableConfig) -> AgentState:
-    m = get_model(config["configurable"].get("model", settings.DEFAULT_MODEL))
-    model_runnable = wrap_model(m)
+    model_runnable = get_model_runnable(config["configurable"].get("model", settings.DEFAULT_MODEL))
     response = await model_runnable.ainvoke(state, config)
 
     # We return a list, because this will get added to the existing list
@@ -1,9 +1,10 @@
+from functools import cache
+
 from langchain_core.tools import tool
-from langgraph.graph import MessagesState, StateGraph, END, START
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import END, START, MessagesState, StateGraph
 from langgraph.prebuilt import ToolNode
-from langchain_openai import ChatOpenAI
 from pydantic import BaseModel
-from langgraph.checkpoint.memory import MemorySaver
 
 
 # Define the tools
@@ -15,15 +16,22 @@ def search(query: str):
 
 class AskHuman(BaseModel):
     """Ask a human a clarifying question."""
+
     question: str
 
 
 tools = [search]
 tool_node = ToolNode(tools)
 
-# Set up the model
-model = ChatOpenAI(model="gpt-4o-mini")
-model = model.bind_tools(tools + [AskHuman])
+
+# Set up the model on first use, so importing the agents package doesn't
+# construct an OpenAI client and bind tools for a demo that isn't being run
+@cache
+def get_demo_model():
+    from langchain_openai import ChatOpenAI
+
+    return ChatOpenAI(model="gpt-4o-mini").bind_tools(tools + [AskHuman])
+
 
 # Define the decision function
 def should_continue(state):
@@ -36,16 +44,19 @@ def should_continue(state):
     else:
         return "continue"
 
+
 # Define the model node function
 def call_model(state):
     messages = state["messages"]
-    response = model.invoke(messages)
+    response = get_demo_model().invoke(messages)
     return {"messages": [response]}
 
+
 # Define the ask_human node
 def ask_human(state):
     return {"messages": [{"type": "human", "content": "What should I do next?"}]}
 
+
 # Build the workflow
 workflow = StateGraph(MessagesState)
 workflow.add_node("agent", call_model)
@@ -53,14 +64,18 @@ workflow.add_node("action", tool_node)
 workflow.add_node("ask_human", ask_human)
 
 workflow.add_edge(START, "agent")
-workflow.add_conditional_edges("agent", should_continue, {
-    "continue": "action",
-    "ask_human": "ask_human",
-    "end": END,
-})
+workflow.add_conditional_edges(
+    "agent",
+    should_continue,
+    {
+        "continue": "action",
+        "ask_human": "ask_human",
+        "end": END,
+    },
+)
 workflow.add_edge("action", "agent")
 workflow.add_edge("ask_human", "agent")
 
 # Compile the workflow with a memory saver
 memory = MemorySaver()
-human_demo = workflow.compile(checkpointer=memory, interrupt_before=["ask_human"])
\ No newline at end of file
+human_demo = workflow.compile(checkpointer=memory, interrupt_before=["ask_human"])
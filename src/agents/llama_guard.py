@@ -1,7 +1,10 @@
 from enum import Enum
+from functools import cache
 
-from langchain_core.messages import AIMessage, AnyMessage, HumanMessage
+from langchain_core.language_models import LanguageModelInput
+from langchain_core.messages import AIMessage, AnyMessage, BaseMessage, HumanMessage
 from langchain_core.prompts import PromptTemplate
+from langchain_core.runnables import Runnable
 from pydantic import BaseModel, Field
 
 from core import get_model, settings
@@ -57,6 +60,8 @@ Provide your safety assessment for ONLY THE LAST {{role}} in the above conversat
 - First line must read 'safe' or 'unsafe'.
 - If unsafe, a second line must include a comma-separated list of violated categories."""
 
+llama_guard_prompt = PromptTemplate.from_template(llama_guard_instructions)
+
 
 def parse_llama_guard_output(output: str) -> LlamaGuardOutput:
     if output == "safe":
@@ -75,14 +80,20 @@ def parse_llama_guard_output(output: str) -> LlamaGuardOutput:
         return LlamaGuardOutput(safety_assessment=SafetyAssessment.ERROR)
 
 
+@cache
+def get_llama_guard_model() -> Runnable[LanguageModelInput, BaseMessage]:
+    # LlamaGuard is constructed on every guarded turn; share one tagged model binding
+    return get_model(GroqModelName.LLAMA_GUARD_3_8B).with_config(tags=["llama_guard"])
+
+
 class LlamaGuard:
     def __init__(self) -> None:
         if settings.GROQ_API_KEY is None:
             print("GROQ_API_KEY not set, skipping LlamaGuard")
             self.model = None
             return
-        self.model = get_model(GroqModelName.LLAMA_GUARD_3_8B).with_config(tags=["llama_guard"])
-        self.prompt = PromptTemplate.from_template(llama_guard_instructions)
+        self.model = get_llama_guard_model()
+        self.prompt = llama_guard_prompt
 
     def _compile_prompt(self, role: str, messages: list[AnyMessage]) -> str:
         role_mapping = {"ai": "Agent", "human": "User"}
@@ -1,4 +1,5 @@
 from datetime import datetime
+from functools import cache
 from typing import Literal
 
 from langchain_community.tools import DuckDuckGoSearchResults, OpenWeatherMapQueryRun
@@ -13,6 +14,7 @@ from langgraph.prebuilt import ToolNode
 from agents.llama_guard import LlamaGuard, LlamaGuardOutput, SafetyAssessment
 from agents.tools import calculator
 from core import get_model, settings
+from schema import AllModelEnum
 
 
 class AgentState(MessagesState, total=False):
@@ -48,15 +50,24 @@ instructions = f"""
     """
 
 
+system_message = SystemMessage(content=instructions)
+preprocessor = RunnableLambda(
+    lambda state: [system_message] + state["messages"],
+    name="StateModifier",
+)
+
+
 def wrap_model(model: BaseChatModel) -> RunnableSerializable[AgentState, AIMessage]:
     model = model.bind_tools(tools)
-    preprocessor = RunnableLambda(
-        lambda state: [SystemMessage(content=instructions)] + state["messages"],
-        name="StateModifier",
-    )
     return preprocessor | model
 
 
+@cache
+def get_model_runnable(model_name: AllModelEnum) -> RunnableSerializable[AgentState, AIMessage]:
+    # Bind tools and build the preprocessor pipeline once per model, not on every turn
+    return wrap_model(get_model(model_name))
+
+
 def format_safety_message(safety: LlamaGuardOutput) -> AIMessage:
     content = (
         f"This conversation was flagged for unsafe content: {', '.join(safety.unsafe_categories)}"
@@ -65,8 +76,7 @@ def format_safety_message(safety: LlamaGuardOutput) -> AIMessage:
 
 
 async def acall_model(state: AgentState, config: RunnableConfig) -> AgentState:
-    m = get_model(config["configurable"].get("model", settings.DEFAULT_MODEL))
-    model_runnable = wrap_model(m)
+    model_runnable = get_model_runnable(config["configurable"].get("model", settings.DEFAULT_MODEL))
     response = await model_runnable.ainvoke(state, config)
 
     # Run llama guard check here to avoid returning the message if it's unsafe